@@ -11,11 +11,18 @@ function getIndexPath(baseDir) {
   return path.join(getBrainDir(baseDir), 'brain_index.json');
 }
 
+// Parsed brain_index.json per path, reused while the file is unchanged (status, /memory and memory_get share it)
+const indexCache = new Map();
+
 function readIndex(baseDir) {
   const fp = getIndexPath(baseDir);
   try {
-    const raw = fs.readFileSync(fp, 'utf8');
-    return JSON.parse(raw);
+    const st = fs.statSync(fp);
+    const cached = indexCache.get(fp);
+    if (cached && cached.mtimeMs === st.mtimeMs && cached.size === st.size) return cached.index;
+    const index = JSON.parse(fs.readFileSync(fp, 'utf8'));
+    indexCache.set(fp, { mtimeMs: st.mtimeMs, size: st.size, index });
+    return index;
   } catch (e) {
     return { files: {}, versions: {} };
   }
@@ -23,8 +30,15 @@ function readIndex(baseDir) {
 
 function writeIndex(index, baseDir) {
   const fp = getIndexPath(baseDir);
-  fs.mkdirSync(path.dirname(fp), { recursive: true });
-  fs.writeFileSync(fp, JSON.stringify(index, null, 2), 'utf8');
+  try {
+    fs.mkdirSync(path.dirname(fp), { recursive: true });
+    fs.writeFileSync(fp, JSON.stringify(index, null, 2), 'utf8');
+    const st = fs.statSync(fp);
+    indexCache.set(fp, { mtimeMs: st.mtimeMs, size: st.size, index });
+  } catch (e) {
+    indexCache.delete(fp);
+    throw e;
+  }
 }
 
 function indexFile(filePath, baseDir) {
@@ -3,7 +3,6 @@
 const path = require('path');
 const fs = require('fs');
 const os = require('os');
-const readline = require('readline');
 const { execSync } = require('child_process');
 
 // Global flags (OpenClaw-style): apply before chalk so colors are disabled when requested
@@ -19,13 +18,12 @@ const { program } = require('commander');
 const crypto = require('crypto');
 const { loadConfig, writeConfig } = require('./config');
 const { callLLM } = require('./api');
-const { runAgentLoop } = require('./agent-loop');
 const { indexAll, getBrainDir, searchMemory, readIndex, indexFile } = require('./brain');
-const { createReplyDispatcher, resolveSessionKey } = require('./gateway');
 const { isFirstRun, isBootstrapActive, hasEstablishedSoul, updateUserProfile, updateSoul, getBootstrapFirstMessage, getBootstrapContext, SCRIPTED_USER_WAKE_UP } = require('./personality');
 const { setupTelegram, sendTelegramMessage, sendChatAction, appendOrReplaceEnv } = require('./telegram-setup');
 const { consumePendingByCode } = require('./pairing');
 const { listAllSkillsWithAuditStatus, listEligibleSkills, discoverSkillDirs } = require('./openclaw-skills');
+const { getTtyInterface, resumeTty, closeTty, ttyAsk, ttyQuestion, ttyQuestionMasked, ttyPrompts } = require('./tty');
 const axios = require('axios');
 
 const ROOT = path.resolve(__dirname, '..');
@@ -49,10 +47,24 @@ const BANNER = `
   ╚═╝  ╚═╝╚══════╝   ╚═╝   ╚═╝  ╚═╝╚══════╝╚═╝  ╚═╝
 `;
 
-function printBanner(color = chalk.blue) {
-  console.log(color(BANNER));
+const BANNER_DEFAULT = chalk.blue(BANNER);
+
+function printBanner(color) {
+  console.log(color ? color(BANNER) : BANNER_DEFAULT);
 }
 
+const TUI_HELP = [
+  '',
+  '  /status  - system status (models, brain, skills)',
+  '  /memory <query> - search brain memory',
+  '  /skills  - list skills',
+  '  /index   - reindex brain files',
+  '  /clear   - clear screen',
+  '  /new, /reset - reset session (fresh context)',
+  '  /quit    - exit',
+  ''
+].join('\n');
+
 function renderProgress(step, total, label) {
   const n = Math.min(step, total);
   const barLen = 10;
@@ -73,13 +85,13 @@ function wrapBox(text, width) {
   return lines;
 }
 function aetherclawBox(title, bodyLines) {
-  const t = '  ' + title + ' ' + '─'.repeat(Math.max(0, BOX_W - title.length - 6)) + '';
-  console.log(t);
+  const out = ['  ' + title + ' ' + '─'.repeat(Math.max(0, BOX_W - title.length - 6)) + ''];
   for (const line of bodyLines) {
     const p = (line + '').padEnd(BOX_W - 6).slice(0, BOX_W - 6);
-    console.log('  ' + p + '  ');
+    out.push('  ' + p + '  ');
   }
-  console.log('  ' + '─'.repeat(BOX_W - 2));
+  out.push('  ' + '─'.repeat(BOX_W - 2));
+  console.log(out.join('\n'));
 }
 function aetherclawStep(title) {
   console.log('  ' + title + ' ' + '─'.repeat(Math.max(0, BOX_W - title.length - 4)));
@@ -203,61 +215,6 @@ function readStdin() {
 const PLANNING_SYSTEM = `You are a coding task planner. Given a user request, produce a clear, ordered plan (numbered steps) only. Include: which files to create or edit, which commands to run, and any checks or tests to add. Output the plan in markdown. Do not write implementation code or code blocks—only the plan.`;
 const CODE_BUILD_SYSTEM = `You are an expert programmer with access to tools: exec, process, read_file, write_file, create_directory, memory_search. Use these tools to run commands, read and write files, create folders, and search memory. To create a folder use create_directory (path e.g. ~/Desktop/name). Do not use fileoperations or createfolder. Only use tools from your tool list; never output raw FunctionCall or tool syntax. Execute the following plan step by step using your tools. Do not only describe—make the edits and run commands as needed.`;
 
-function ttyQuestion(prompt, defaultVal = '') {
-  return new Promise((resolve) => {
-    const rl = readline.createInterface({ input: process.stdin, output: process.stdout });
-    const p = defaultVal ? `${prompt} [${defaultVal}]: ` : `${prompt} `;
-    rl.question(p, (answer) => {
-      rl.close();
-      resolve((answer && answer.trim()) || defaultVal);
-    });
-  });
-}
-
-/** Ask for input with masked echo (e.g. API key). Uses * per character. */
-function ttyQuestionMasked(prompt) {
-  return new Promise((resolve) => {
-    const stdin = process.stdin;
-    const stdout = process.stdout;
-    if (!stdin.isTTY) {
-      return ttyQuestion(prompt).then(resolve);
-    }
-    stdout.write(prompt);
-    stdin.setRawMode(true);
-    stdin.resume();
-    stdin.setEncoding('utf8');
-    let secret = '';
-    const cleanup = () => {
-      stdin.removeListener('data', onData);
-      stdin.setRawMode(false);
-      stdin.pause();
-    };
-    const onData = (ch) => {
-      if (ch === '\n' || ch === '\r' || ch === '\u0004') {
-        cleanup();
-        stdout.write('\n');
-        resolve(secret.trim());
-        return;
-      }
-      if (ch === '\u0003') {
-        cleanup();
-        process.exit(130);
-        return;
-      }
-      if (ch === '\u007f' || ch === '\b') {
-        if (secret.length > 0) {
-          secret = secret.slice(0, -1);
-          stdout.write('\b \b');
-        }
-        return;
-      }
-      secret += ch;
-      stdout.write('*');
-    };
-    stdin.on('data', onData);
-  });
-}
-
 const ONBOARD_SECURITY_BODY = `Security warning — please read.
 
 This bot can read files and run actions if tools are enabled.
@@ -562,10 +519,7 @@ async function cmdOnboard() {
         openclawStepValue(keepToken === 'yes' || keepToken === 'y' ? 'Yes' : 'No');
         console.log('│');
         try {
-          await setupTelegram(path.join(ROOT, '.env'), {
-            question: ttyQuestion,
-            questionMasked: ttyQuestionMasked
-          });
+          await setupTelegram(path.join(ROOT, '.env'), ttyPrompts);
         } catch (e) {
           console.log('  ⚠ Telegram setup skipped: ' + (e.message || e) + '\n');
         }
@@ -772,7 +726,7 @@ async function cmdOnboard() {
       console.log('  Opening browser...');
       openBrowser();
       console.log('  Press Enter to open in browser again, or Ctrl+C to stop the server.\n');
-      const rl = readline.createInterface({ input: process.stdin, output: process.stdout });
+      const rl = resumeTty();
       rl.on('line', () => { openBrowser(); });
     }, 1800);
     await new Promise((res) => child.on('close', res));
@@ -783,10 +737,7 @@ async function cmdOnboard() {
       console.log('  Telegram is already connected. Run the gateway to receive messages: ' + chalk.cyan('aetherclaw daemon') + '\n');
     } else {
       try {
-        await setupTelegram(path.join(ROOT, '.env'), {
-          question: ttyQuestion,
-          questionMasked: ttyQuestionMasked
-        });
+        await setupTelegram(path.join(ROOT, '.env'), ttyPrompts);
         console.log('  Run the gateway daemon to receive Telegram messages: ' + chalk.cyan('aetherclaw daemon') + '\n');
       } catch (e) {
         console.log('  ⚠ Telegram setup: ' + (e.message || e) + '\n');
@@ -830,23 +781,28 @@ function cmdStatus(opts = {}) {
     }, null, 0));
     return;
   }
-  console.log(chalk.cyan('\nAether-Claw Status'));
-  console.log('─'.repeat(50));
-  console.log('Version: ', config.version);
-  console.log('Brain:   ', path.join(ROOT, 'brain'));
-  console.log('Indexed: ', fileCount, 'files');
-  console.log('Skills:  ', allSkills.length, 'found (' + eligible.length + ' passed audit)');
-  console.log('Safety:  ', config.safety_gate?.enabled ? 'ON' : 'OFF');
+  const lines = [
+    chalk.cyan('\nAether-Claw Status'),
+    '─'.repeat(50),
+    'Version:  ' + config.version,
+    'Brain:    ' + path.join(ROOT, 'brain'),
+    'Indexed:  ' + fileCount + ' files',
+    'Skills:   ' + allSkills.length + ' found (' + eligible.length + ' passed audit)',
+    'Safety:   ' + (config.safety_gate?.enabled ? 'ON' : 'OFF')
+  ];
   const reasoning = config.model_routing?.tier_1_reasoning?.model;
   const action = config.model_routing?.tier_2_action?.model;
-  if (reasoning) console.log('Reasoning:', reasoning);
-  if (action) console.log('Action:   ', action);
-  console.log('');
+  if (reasoning) lines.push('Reasoning: ' + reasoning);
+  if (action) lines.push('Action:    ' + action);
+  console.log(lines.join('\n') + '\n');
 }
 
+/** Personality setup intro, styled once at load instead of on every run. */
+const PERSONALITY_SETUP_INTRO = '\n  ' + chalk.green('✨ Wake up! ✨') + '\n\n' +
+  '  First run — want to tell me about yourself? [Y/n]\n';
+
 async function runPersonalitySetup() {
-  console.log('\n  ' + chalk.green('✨ Wake up! ✨') + '\n');
-  console.log('  First run — want to tell me about yourself? [Y/n]\n');
+  console.log(PERSONALITY_SETUP_INTRO);
   const doSetup = (await ttyQuestion('  Set up personality?', 'y')).trim().toLowerCase();
   if (doSetup === 'n') {
     console.log('  No problem. You can chat anytime.\n');
@@ -967,7 +923,7 @@ async function cmdConfigure(opts) {
   };
 
   const runTelegram = async () => {
-    await setupTelegram(path.join(ROOT, '.env'), { question: ttyQuestion, questionMasked: ttyQuestionMasked });
+    await setupTelegram(path.join(ROOT, '.env'), ttyPrompts);
   };
 
   const MODELS = {
@@ -1085,72 +1041,74 @@ async function cmdTui() {
   }
   console.log('Type /help for commands, /quit to exit.\n');
 
-  const rl = readline.createInterface({ input: process.stdin, output: process.stdout });
-  const ask = (prompt) => new Promise((res) => rl.question(prompt, res));
+  const ask = ttyAsk;
 
+  // Agent pipeline (tools, agent loop, skills) is only loaded by commands that chat
+  const { createReplyDispatcher, resolveSessionKey } = require('./gateway');
+  const { clearSession } = require('./tools');
+  const { runHooks } = require('./hooks');
   const replyDispatcher = createReplyDispatcher({ workspaceRoot: ROOT });
   const tuiSessionKey = resolveSessionKey({ channel: 'tui' });
 
-  while (true) {
-    const line = await ask(chalk.cyan('> '));
-    const input = (line || '').trim();
-    if (!input) continue;
-
-    if (input === '/quit' || input === '/exit' || input === '/q') {
-      console.log(chalk.yellow('Goodbye!\n'));
-      rl.close();
-      process.exit(0);
-    }
-    if (input === '/help') {
-      console.log('\n  /status  - system status (models, brain, skills)');
-      console.log('  /memory <query> - search brain memory');
-      console.log('  /skills  - list skills');
-      console.log('  /index   - reindex brain files');
-      console.log('  /clear   - clear screen');
-      console.log('  /new, /reset - reset session (fresh context)');
-      console.log('  /quit    - exit\n');
-      continue;
-    }
-    if (input === '/status') {
-      cmdStatus();
-      continue;
-    }
-    if (input === '/clear') {
-      console.clear();
-      continue;
-    }
-    if (input === '/new' || input === '/reset') {
-      const { clearSession } = require('./tools');
-      clearSession(tuiSessionKey);
-      try {
-        const { runHooks } = require('./hooks');
-        runHooks(ROOT, 'on_session_reset', { sessionKey: tuiSessionKey });
-      } catch (_) {}
-      console.log(chalk.dim('  Session reset. Next message starts fresh.\n'));
-      continue;
-    }
-    if (input === '/skills') {
+  // /quit, Ctrl+D and Ctrl+C all end up closing the shared interface; exit from one place
+  getTtyInterface().once('close', () => {
+    console.log(chalk.yellow('Goodbye!\n'));
+    process.exit(0);
+  });
+  const quit = () => closeTty();
+  const resetSession = () => {
+    clearSession(tuiSessionKey);
+    try {
+      runHooks(ROOT, 'on_session_reset', { sessionKey: tuiSessionKey });
+    } catch (_) {}
+    console.log(chalk.dim('  Session reset. Next message starts fresh.\n'));
+  };
+  // Slash commands: one lookup on the first token instead of testing each command in turn
+  const commands = {
+    '/quit': quit,
+    '/exit': quit,
+    '/q': quit,
+    '/help': () => console.log(TUI_HELP),
+    '/status': () => cmdStatus(),
+    '/clear': () => console.clear(),
+    '/new': resetSession,
+    '/reset': resetSession,
+    '/skills': () => {
       const skills = listAllSkillsWithAuditStatus(ROOT);
       if (skills.length === 0) console.log('\n  No skills in skills/ (add SKILL.md subdirs or use clawhub install)\n');
       else {
-        console.log('\n  Skills:');
-        skills.forEach((s) => console.log('    ' + (s.audit === 'passed' ? '✓' : '○') + ' ' + s.name + (s.audit === 'failed' ? ' (audit failed)' : '')));
-        console.log('');
+        const lines = skills.map((s) => '    ' + (s.audit === 'passed' ? '✓' : '○') + ' ' + s.name + (s.audit === 'failed' ? ' (audit failed)' : ''));
+        console.log('\n  Skills:\n' + lines.join('\n') + '\n');
       }
-      continue;
-    }
-    if (input === '/index') {
+    },
+    '/index': () => {
       const results = indexAll(ROOT);
       console.log('\n  Indexed ' + Object.keys(results).length + ' files.\n');
-      continue;
-    }
-    if (input.startsWith('/memory ')) {
-      const q = input.slice(8).trim();
+    },
+    '/memory': (q) => {
+      if (!q) {
+        console.log('\n  Usage: /memory <query>\n');
+        return;
+      }
       const hits = searchMemory(q, ROOT, 5);
-      console.log('\n  Results: ' + hits.length);
-      hits.forEach((h, i) => console.log('  ' + (i + 1) + '. ' + h.file_name + ': ' + h.content.slice(0, 80) + '...'));
-      console.log('');
-      continue;
+      const lines = ['\n  Results: ' + hits.length];
+      hits.forEach((h, i) => lines.push('  ' + (i + 1) + '. ' + h.file_name + ': ' + h.content.slice(0, 80) + '...'));
+      console.log(lines.join('\n') + '\n');
+    }
+  };
+
+  while (true) {
+    const line = await ask(chalk.cyan('> '));
+    const input = (line || '').trim();
+    if (!input) continue;
+
+    if (input.startsWith('/')) {
+      const space = input.indexOf(' ');
+      const handler = commands[space === -1 ? input : input.slice(0, space)];
+      if (handler) {
+        handler(space === -1 ? '' : input.slice(space + 1).trim());
+        continue;
+      }
     }
 
     console.log(chalk.dim('Thinking...'));
@@ -1168,10 +1126,7 @@ async function cmdTui() {
 async function cmdTelegramSetup() {
   const envPath = path.join(ROOT, '.env');
   const skipPrompt = process.argv.includes('--yes') || process.argv.includes('-y');
-  await setupTelegram(envPath, {
-    question: ttyQuestion,
-    questionMasked: ttyQuestionMasked
-  }, { skipConnectPrompt: skipPrompt });
+  await setupTelegram(envPath, ttyPrompts, { skipConnectPrompt: skipPrompt });
 }
 
 async function cmdTelegram() {
@@ -1292,6 +1247,7 @@ async function cmdCode(taskArg, opts = {}) {
     ? `Task: ${task}\n\nPlan to execute:\n${plan}`
     : task;
   try {
+    const { runAgentLoop } = require('./agent-loop');
     const result = await runAgentLoop(ROOT, buildUserMessage, CODE_BUILD_SYSTEM, config, {
       tier: 'action',
       max_tokens: 4096
@@ -13,7 +13,7 @@ require('dotenv').config({ path: path.join(__dirname, '..', '.env') });
 const axios = require('axios');
 const { loadConfig } = require('./config');
 const { indexAll } = require('./brain');
-const { sendTelegramMessage, sendChatAction } = require('./telegram-setup');
+const { sendTelegramMessage, sendChatAction, generatePairingCode } = require('./telegram-setup');
 const { isFirstRun, getBootstrapFirstMessage } = require('./personality');
 const { createReplyDispatcher, resolveSessionKey } = require('./gateway');
 const { addPending } = require('./pairing');
@@ -100,7 +100,7 @@ async function runTelegramLoop() {
           const text = (msg.text || '').trim();
           const isUnknownChat = !pairedChatId || chatId !== pairedChatId;
           if (isUnknownChat) {
-            const code = String(Math.floor(100000 + Math.random() * 900000));
+            const code = generatePairingCode();
             addPending(ROOT, chatId, code);
             await sendTelegramMessage(token, chatId, `To pair with Aether-Claw, run in your terminal:\n\n\`aetherclaw pairing approve ${code}\`\n\nYour code: ${code}`);
             continue;
@@ -16,7 +16,19 @@ const { readIndex } = require('./brain');
 const { createReplyDispatcher, resolveSessionKey } = require('./gateway');
 const { isFirstRun, getBootstrapFirstMessage } = require('./personality');
 
+/** Status is polled by the UI and /status; skills audit + index read are cached briefly between polls. */
+const STATUS_TTL_MS = 5000;
+let statusCache = { at: 0, value: null };
+
 function getSystemStatus() {
+  const now = Date.now();
+  if (statusCache.value && now - statusCache.at < STATUS_TTL_MS) return statusCache.value;
+  const value = buildSystemStatus();
+  if (!value.error) statusCache = { at: now, value };
+  return value;
+}
+
+function buildSystemStatus() {
   try {
     const config = loadConfig(path.join(ROOT, 'swarm_config.json'));
     const index = readIndex(ROOT);
@@ -241,15 +253,15 @@ const HTML = `<!DOCTYPE html>
     const sendBtn = document.getElementById('sendBtn');
     let history = JSON.parse(sessionStorage.getItem('aetherHistory') || '[]');
     const COLLAPSE_THRESHOLD = 800;
-    function renderHistory() {
-      messagesEl.innerHTML = history.map((m) => {
-        let html = m.role === 'assistant' ? renderMarkdown(m.content) : escapeHtml(m.content);
-        const isLong = m.role === 'assistant' && m.content && m.content.length > COLLAPSE_THRESHOLD;
-        const contentClass = isLong ? 'content collapsible' : 'content';
-        const showMore = isLong ? '<span class="show-more-less" data-action="expand">Show more</span>' : '';
-        return '<div class="msg ' + m.role + '"><div class="role">' + m.role + '</div><div class="' + contentClass + '">' + html + showMore + '</div></div>';
-      }).join('');
-      messagesEl.querySelectorAll('.msg .content pre').forEach((pre) => {
+    function messageHtml(m) {
+      let html = m.role === 'assistant' ? renderMarkdown(m.content) : escapeHtml(m.content);
+      const isLong = m.role === 'assistant' && m.content && m.content.length > COLLAPSE_THRESHOLD;
+      const contentClass = isLong ? 'content collapsible' : 'content';
+      const showMore = isLong ? '<span class="show-more-less" data-action="expand">Show more</span>' : '';
+      return '<div class="msg ' + m.role + '"><div class="role">' + m.role + '</div><div class="' + contentClass + '">' + html + showMore + '</div></div>';
+    }
+    function wireMessages(root) {
+      root.querySelectorAll('.msg .content pre').forEach((pre) => {
         const code = pre.querySelector('code');
         const text = code ? code.textContent : pre.textContent;
         const btn = document.createElement('button');
@@ -261,7 +273,7 @@ const HTML = `<!DOCTYPE html>
         });
         pre.appendChild(btn);
       });
-      messagesEl.querySelectorAll('.show-more-less').forEach((el) => {
+      root.querySelectorAll('.show-more-less').forEach((el) => {
         el.addEventListener('click', () => {
           const content = el.closest('.msg').querySelector('.content');
           const isExpanded = content.classList.contains('expanded');
@@ -269,13 +281,24 @@ const HTML = `<!DOCTYPE html>
           el.textContent = isExpanded ? 'Show more' : 'Show less';
         });
       });
+    }
+    function renderHistory() {
+      messagesEl.innerHTML = history.map(messageHtml).join('');
+      wireMessages(messagesEl);
       messagesEl.scrollTop = messagesEl.scrollHeight;
     }
     function escapeHtml(s) { const d = document.createElement('div'); d.textContent = s; return d.innerHTML; }
+    // New messages are appended; earlier ones are already rendered and are not re-parsed
     function addMessage(role, content) {
-      history.push({ role, content });
+      const m = { role, content };
+      history.push(m);
       sessionStorage.setItem('aetherHistory', JSON.stringify(history));
-      renderHistory();
+      const wrap = document.createElement('div');
+      wrap.innerHTML = messageHtml(m);
+      const el = wrap.firstChild;
+      messagesEl.appendChild(el);
+      wireMessages(el);
+      messagesEl.scrollTop = messagesEl.scrollHeight;
     }
     renderHistory();
     const bannerEl = document.getElementById('chatBanner');
@@ -346,9 +369,20 @@ const HTML = `<!DOCTYPE html>
       document.getElementById('configRaw').textContent = JSON.stringify(d, null, 2);
     }
     let securityPollTimer = null;
+    let lastSecurityBody = null;
     async function loadSecurity() {
       const res = await fetch('/api/security');
-      const d = await res.json();
+      const body = await res.text();
+      // The 30s poll usually returns what is already shown; only rebuild the panel when it changed
+      const changed = body !== lastSecurityBody;
+      lastSecurityBody = body;
+      const d = JSON.parse(body);
+      if (changed) renderSecurity(d);
+      if (d.error) return;
+      if (securityPollTimer) clearInterval(securityPollTimer);
+      securityPollTimer = setInterval(loadSecurity, 30000);
+    }
+    function renderSecurity(d) {
       const warnEl = document.getElementById('securityWarnings');
       const gridEl = document.getElementById('securityGrid');
       const skillsEl = document.getElementById('securitySkills');
@@ -380,8 +414,6 @@ const HTML = `<!DOCTYPE html>
         skillsEl.innerHTML = '';
       }
       rawEl.textContent = JSON.stringify(d, null, 2);
-      if (securityPollTimer) clearInterval(securityPollTimer);
-      securityPollTimer = setInterval(loadSecurity, 30000);
     }
   </script>
 </body>
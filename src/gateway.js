@@ -8,11 +8,12 @@
  */
 
 const path = require('path');
+const fs = require('fs');
 const { loadConfig } = require('./config');
 const { runAgentLoop } = require('./agent-loop');
 const { classifyComplexity, tierFromScore } = require('./complexity');
 const { getSessionHistory, pushSessionMessage, SESSION_MAIN } = require('./tools');
-const { buildWorkspaceSkillSnapshot } = require('./openclaw-skills');
+const { buildWorkspaceSkillSnapshot, listAllSkillsWithAuditStatus } = require('./openclaw-skills');
 const { isFirstRun, getBootstrapContext } = require('./personality');
 
 const ROOT_DEFAULT = path.resolve(__dirname, '..');
@@ -73,6 +74,24 @@ function buildSystemPromptForRun(workspaceRoot, opts = {}) {
  */
 function createReplyDispatcher(config = {}) {
   const workspaceRoot = config.workspaceRoot || ROOT_DEFAULT;
+  const configPath = path.join(workspaceRoot, 'swarm_config.json');
+  let cachedCfg = null;
+  let cachedCfgMtime = null;
+
+  /** Config for this turn; re-read only when swarm_config.json changes (configure can edit it mid-session). */
+  function getConfig() {
+    let mtime = 0;
+    try {
+      mtime = fs.statSync(configPath).mtimeMs;
+    } catch (_) {
+      // missing file: loadConfig falls back to defaults
+    }
+    if (!cachedCfg || mtime !== cachedCfgMtime) {
+      cachedCfg = loadConfig(configPath);
+      cachedCfgMtime = mtime;
+    }
+    return cachedCfg;
+  }
 
   return async function reply(sessionKey, body, context = {}) {
     const key = sessionKey || SESSION_MAIN;
@@ -94,7 +113,6 @@ function createReplyDispatcher(config = {}) {
     }
     if (text === '/skills') {
       try {
-        const { listAllSkillsWithAuditStatus } = require('./openclaw-skills');
         const skills = listAllSkillsWithAuditStatus(workspaceRoot);
         if (skills.length === 0) return { reply: 'No skills in skills/ (add SKILL.md subdirs).' };
         const lines = skills.map(s => (s.audit === 'passed' ? '✓' : '○') + ' ' + s.name);
@@ -104,7 +122,7 @@ function createReplyDispatcher(config = {}) {
       }
     }
 
-    const cfg = loadConfig(path.join(workspaceRoot, 'swarm_config.json'));
+    const cfg = getConfig();
     const skillsSnapshot = buildWorkspaceSkillSnapshot(workspaceRoot);
     const systemPrompt = buildSystemPromptForRun(workspaceRoot, { skillsSnapshot });
     const conversationHistory = getSessionHistory(key, 20).map(m => ({
@@ -46,16 +46,42 @@ function getBootstrapContext(root) {
   return '\n\n## Bootstrap / project context\n\n' + combined;
 }
 
+/** Resolved brain/ file paths per workspace root; built once instead of re-joined on every check. */
+const brainPathCache = new Map();
+
+function getBrainPaths(root) {
+  let paths = brainPathCache.get(root);
+  if (!paths) {
+    const brainDir = path.resolve(root, 'brain');
+    paths = {
+      user: path.join(brainDir, 'user.md'),
+      soul: path.join(brainDir, 'soul.md'),
+      bootstrap: path.join(brainDir, 'BOOTSTRAP.md')
+    };
+    brainPathCache.set(root, paths);
+  }
+  return paths;
+}
+
 function getUserPath(root) {
-  return path.join(root, 'brain', 'user.md');
+  return getBrainPaths(root).user;
 }
 
 function getSoulPath(root) {
-  return path.join(root, 'brain', 'soul.md');
+  return getBrainPaths(root).soul;
 }
 
 function getBootstrapPath(root) {
-  return path.join(root, 'brain', 'BOOTSTRAP.md');
+  return getBrainPaths(root).bootstrap;
+}
+
+/** Read a file, or null if it does not exist (one syscall instead of existsSync + read). */
+function readIfExists(filePath) {
+  try {
+    return fs.readFileSync(filePath, 'utf8');
+  } catch (e) {
+    return null;
+  }
 }
 
 function isBootstrapActive(root) {
@@ -67,12 +93,11 @@ const SOUL_DEFAULT_TEMPLATE = '# Soul\n\nAgent identity and goals.\n';
 
 /** True if soul.md exists and has been customized (not just the default template). */
 function hasEstablishedSoul(root) {
-  const soulPath = getSoulPath(root);
-  if (!fs.existsSync(soulPath)) return false;
-  const content = fs.readFileSync(soulPath, 'utf8').trim();
-  if (content.length <= SOUL_DEFAULT_TEMPLATE.length + 2) return false;
-  if (content === SOUL_DEFAULT_TEMPLATE.trim()) return false;
-  return true;
+  const minLength = SOUL_DEFAULT_TEMPLATE.length + 2;
+  const raw = readIfExists(getSoulPath(root));
+  // The length check alone rules out the default template; only trim when the raw file is long enough to matter
+  if (raw === null || raw.length <= minLength) return false;
+  return raw.trim().length > minLength;
 }
 
 /** First run = bootstrap active and no established soul. Established soul = not first run. */
@@ -80,33 +105,37 @@ function isFirstRun(root) {
   return isBootstrapActive(root) && !hasEstablishedSoul(root);
 }
 
+const NAME_PLACEHOLDER_RE = /\[Your name\]|\[To be filled[^\]]*\]/i;
+const PRIMARY_WORK_RE = /- \*\*Primary Work\*\*:.*/m;
+const DEFAULT_VIBE_RE = /- Concise, technical responses preferred/m;
+const LAST_UPDATED_RE = /> \*\*Last Updated\*\*:.*/m;
+const SOUL_NAME_RE = /- \*\*Name\*\*:.*/m;
+const SOUL_VIBE_RE = /- \*\*Vibe\*\*:.*/m;
+const SOUL_ROLE_RE = /- \*\*Role\*\*:.*/m;
+
+function lastUpdatedLine() {
+  return `> **Last Updated**: ${new Date().toISOString().slice(0, 10)}`;
+}
+
 function updateUserProfile(root, name, projects, vibe) {
   const userPath = getUserPath(root);
-  let content = '';
-  try {
-    content = fs.readFileSync(userPath, 'utf8');
-  } catch (e) {
-    content = '# User\n\n- **Name**: [Your name]\n- **Primary Work**: \n\n### Communication Style\n\n- \n';
-  }
-  content = content.replace(/\[Your name\]|\[To be filled[^\]]*\]/i, name || 'friend');
-  if (projects && content.includes('**Primary Work**')) {
-    content = content.replace(/- \*\*Primary Work\*\*:.*/m, `- **Primary Work**: ${projects}`);
-  }
+  const original = readIfExists(userPath);
+  let content = original !== null
+    ? original
+    : '# User\n\n- **Name**: [Your name]\n- **Primary Work**: \n\n### Communication Style\n\n- \n';
+  content = content.replace(NAME_PLACEHOLDER_RE, name || 'friend');
+  if (projects) content = content.replace(PRIMARY_WORK_RE, `- **Primary Work**: ${projects}`);
   if (vibe && content.includes('Communication Style')) {
-    content = content.replace(/- Concise, technical responses preferred/m, `- ${vibe}`);
+    content = content.replace(DEFAULT_VIBE_RE, `- ${vibe}`);
   }
-  const updated = content.replace(/> \*\*Last Updated\*\*:.*/m, `> **Last Updated**: ${new Date().toISOString().slice(0, 10)}`);
-  fs.writeFileSync(userPath, updated, 'utf8');
+  const updated = content.replace(LAST_UPDATED_RE, lastUpdatedLine());
+  if (updated !== original) fs.writeFileSync(userPath, updated, 'utf8');
 }
 
 function updateSoul(root, agentName, vibe, dynamic) {
   const soulPath = getSoulPath(root);
-  let content = '';
-  try {
-    content = fs.readFileSync(soulPath, 'utf8');
-  } catch (e) {
-    content = '# Soul\n\n## Core Identity\n\n';
-  }
+  const original = readIfExists(soulPath);
+  let content = original !== null ? original : '# Soul\n\n## Core Identity\n\n';
   if (!content.includes('## Personality')) {
     const insert = `\n## Personality\n\n- **Name**: ${agentName}\n- **Vibe**: ${vibe}\n- **Role**: ${dynamic}\n\n`;
     if (content.includes('## Core Identity')) {
@@ -119,12 +148,12 @@ function updateSoul(root, agentName, vibe, dynamic) {
       content += insert;
     }
   } else {
-    content = content.replace(/- \*\*Name\*\*:.*/m, `- **Name**: ${agentName}`);
-    content = content.replace(/- \*\*Vibe\*\*:.*/m, `- **Vibe**: ${vibe}`);
-    content = content.replace(/- \*\*Role\*\*:.*/m, `- **Role**: ${dynamic}`);
+    content = content.replace(SOUL_NAME_RE, `- **Name**: ${agentName}`);
+    content = content.replace(SOUL_VIBE_RE, `- **Vibe**: ${vibe}`);
+    content = content.replace(SOUL_ROLE_RE, `- **Role**: ${dynamic}`);
   }
-  content = content.replace(/> \*\*Last Updated\*\*:.*/m, `> **Last Updated**: ${new Date().toISOString().slice(0, 10)}`);
-  fs.writeFileSync(soulPath, content, 'utf8');
+  content = content.replace(LAST_UPDATED_RE, lastUpdatedLine());
+  if (content !== original) fs.writeFileSync(soulPath, content, 'utf8');
 }
 
 module.exports = {
@@ -3,17 +3,29 @@
  */
 
 const fs = require('fs');
+const crypto = require('crypto');
+const https = require('https');
 const axios = require('axios');
 
 const TELEGRAM_API = 'https://api.telegram.org/bot';
+const LONG_POLL_SECONDS = 50;
+const POLL_ERROR_BACKOFF_MS = 2000;
+/** Only message updates are consumed; filtering server-side keeps getUpdates payloads small to parse. */
+const MESSAGE_UPDATES_ONLY = JSON.stringify(['message']);
 
+/** One keep-alive client for every Bot API call so the TLS session to api.telegram.org is reused. */
+const telegramHttp = axios.create({
+  httpsAgent: new https.Agent({ keepAlive: true })
+});
+
+/** 6-digit pairing code from a CSPRNG (Math.random is predictable). */
 function generatePairingCode() {
-  return String(Math.floor(100000 + Math.random() * 900000));
+  return String(crypto.randomInt(1000000)).padStart(6, '0');
 }
 
 async function verifyBotToken(token) {
   try {
-    const { data } = await axios.get(`${TELEGRAM_API}${token}/getMe`, { timeout: 10000 });
+    const { data } = await telegramHttp.get(`${TELEGRAM_API}${token}/getMe`, { timeout: 10000 });
     if (data.ok && data.result) return { ok: true, bot: data.result };
     return { ok: false };
   } catch (e) {
@@ -23,7 +35,7 @@ async function verifyBotToken(token) {
 
 async function sendTelegramMessage(token, chatId, text) {
   try {
-    const { data } = await axios.post(
+    const { data } = await telegramHttp.post(
       `${TELEGRAM_API}${token}/sendMessage`,
       { chat_id: chatId, text, parse_mode: 'Markdown' },
       { timeout: 10000 }
@@ -36,7 +48,7 @@ async function sendTelegramMessage(token, chatId, text) {
 
 async function sendChatAction(token, chatId, action) {
   try {
-    const { data } = await axios.post(
+    const { data } = await telegramHttp.post(
       `${TELEGRAM_API}${token}/sendChatAction`,
       { chat_id: chatId, action },
       { timeout: 5000 }
@@ -47,68 +59,86 @@ async function sendChatAction(token, chatId, action) {
   }
 }
 
-async function waitForStart(token, timeoutMs = 300000) {
-  const step = 2000;
+/**
+ * Long-poll getUpdates until predicate(message) matches or the deadline passes.
+ * Telegram holds each request open until an update arrives, so there is no client-side sleep;
+ * polls reuse the shared keep-alive connection. Returns the matching message, or null on timeout.
+ */
+async function pollUpdates(token, predicate, timeoutMs) {
   let offset = 0;
   const deadline = Date.now() + timeoutMs;
-  while (Date.now() < deadline) {
+  let remaining;
+  while ((remaining = deadline - Date.now()) > 0) {
+    const pollSeconds = Math.max(1, Math.min(LONG_POLL_SECONDS, Math.floor(remaining / 1000)));
     try {
-      const url = offset ? `${TELEGRAM_API}${token}/getUpdates?offset=${offset}` : `${TELEGRAM_API}${token}/getUpdates`;
-      const { data } = await axios.get(url, { timeout: 15000 });
+      const { data } = await telegramHttp.get(`${TELEGRAM_API}${token}/getUpdates`, {
+        params: { offset: offset || undefined, timeout: pollSeconds, allowed_updates: MESSAGE_UPDATES_ONLY },
+        timeout: (pollSeconds + 10) * 1000
+      });
       if (data.ok && Array.isArray(data.result)) {
         for (const update of data.result) {
           offset = update.update_id + 1;
           const msg = update.message;
-          if (msg && msg.chat && (msg.text || '').trim() === '/start') {
-            return { chatId: String(msg.chat.id), userName: (msg.from && msg.from.first_name) || 'User' };
-          }
+          if (msg && msg.chat && predicate(msg)) return msg;
         }
       }
     } catch (e) {
-      // ignore
+      // network error or conflict: back off instead of spinning
+      await new Promise((r) => setTimeout(r, POLL_ERROR_BACKOFF_MS));
     }
-    await new Promise((r) => setTimeout(r, step));
   }
   return null;
 }
 
+async function waitForStart(token, timeoutMs = 300000) {
+  const msg = await pollUpdates(token, (m) => (m.text || '').trim() === '/start', timeoutMs);
+  if (!msg) return null;
+  return { chatId: String(msg.chat.id), userName: (msg.from && msg.from.first_name) || 'User' };
+}
+
 async function waitForPairingCode(token, chatId, code, timeoutMs = 300000) {
-  const step = 2000;
-  let offset = 0;
-  const deadline = Date.now() + timeoutMs;
-  while (Date.now() < deadline) {
-    try {
-      const url = offset ? `${TELEGRAM_API}${token}/getUpdates?offset=${offset}` : `${TELEGRAM_API}${token}/getUpdates`;
-      const { data } = await axios.get(url, { timeout: 15000 });
-      if (data.ok && Array.isArray(data.result)) {
-        for (const update of data.result) {
-          offset = update.update_id + 1;
-          const msg = update.message;
-          if (msg && String(msg.chat.id) === chatId && (msg.text || '').trim() === code) {
-            return true;
-          }
-        }
-      }
-    } catch (e) {
-      // ignore
-    }
-    await new Promise((r) => setTimeout(r, step));
+  // Telegram chat ids are integers; compare numerically instead of stringifying every update
+  const expectedChat = Number(chatId);
+  const msg = await pollUpdates(token, (m) => m.chat.id === expectedChat && (m.text || '').trim() === code, timeoutMs);
+  return msg !== null;
+}
+
+const envKeyPatterns = new Map();
+
+function envKeyPattern(key) {
+  let re = envKeyPatterns.get(key);
+  if (!re) {
+    re = new RegExp(`^${key}=.*$`, 'm');
+    envKeyPatterns.set(key, re);
   }
-  return false;
+  return re;
 }
 
-function appendOrReplaceEnv(envPath, key, value) {
+/** Set several KEY=value lines in one read + one write; replaces existing keys in place, appends the rest. */
+function setEnvValues(envPath, values) {
   let content = '';
-  if (fs.existsSync(envPath)) content = fs.readFileSync(envPath, 'utf8');
-  const line = `${key}=${value}\n`;
-  if (new RegExp(`^${key}=`, 'm').test(content)) {
-    content = content.replace(new RegExp(`^${key}=.*`, 'm'), `${key}=${value}\n`);
-  } else {
-    content = content.trimEnd() + (content ? '\n' : '') + line;
+  try {
+    content = fs.readFileSync(envPath, 'utf8');
+  } catch (e) {
+    if (e.code !== 'ENOENT') throw e;
+  }
+  const missing = [];
+  for (const [key, value] of Object.entries(values)) {
+    let found = false;
+    content = content.replace(envKeyPattern(key), () => {
+      found = true;
+      return `${key}=${value}`;
+    });
+    if (!found) missing.push(`${key}=${value}\n`);
   }
+  if (missing.length) content = content.trimEnd() + (content ? '\n' : '') + missing.join('');
   fs.writeFileSync(envPath, content, 'utf8');
 }
 
+function appendOrReplaceEnv(envPath, key, value) {
+  setEnvValues(envPath, { [key]: value });
+}
+
 function hadTelegramBefore(envPath) {
   if (!envPath || !fs.existsSync(envPath)) return false;
   try {
@@ -196,8 +226,7 @@ async function setupTelegram(envPath, { question, questionMasked }, options = {}
   await sendTelegramMessage(token, chatId, "📌 _Replies when the gateway daemon is running._ Install or restart it: run `install.sh` → choose gateway install/restart.");
   console.log('\n  💾 Saving...');
   try {
-    appendOrReplaceEnv(envPath, 'TELEGRAM_BOT_TOKEN', token);
-    appendOrReplaceEnv(envPath, 'TELEGRAM_CHAT_ID', chatId);
+    setEnvValues(envPath, { TELEGRAM_BOT_TOKEN: token, TELEGRAM_CHAT_ID: chatId });
     process.env.TELEGRAM_BOT_TOKEN = token;
     process.env.TELEGRAM_CHAT_ID = chatId;
     console.log('  ✓ Credentials saved to .env');
@@ -211,4 +240,4 @@ async function setupTelegram(envPath, { question, questionMasked }, options = {}
   }
 }
 
-module.exports = { setupTelegram, verifyBotToken, sendTelegramMessage, sendChatAction, appendOrReplaceEnv };
+module.exports = { setupTelegram, generatePairingCode, verifyBotToken, sendTelegramMessage, sendChatAction, appendOrReplaceEnv, setEnvValues };
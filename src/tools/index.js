@@ -968,29 +968,41 @@ function deepMerge(target, src) {
 // In-memory session store for sessions_list / sessions_history / session_status (minimal)
 const sessionStore = new Map();
 const SESSION_MAIN = 'main';
+// Each session is a bounded buffer: once it passes MAX it is cut back to TRIM_TO in one splice (amortized O(1) per push)
+const SESSION_MAX_MESSAGES = 100;
+const SESSION_TRIM_TO = 50;
 function getSessionHistory(sessionKey, limit = 20) {
   const list = sessionStore.get(sessionKey) || [];
   return list.slice(-limit);
 }
 function pushSessionMessage(sessionKey, role, content) {
-  const list = sessionStore.get(sessionKey) || [];
-  list.push({ role, content, at: new Date().toISOString() });
-  if (list.length > 100) list.splice(0, list.length - 50);
-  sessionStore.set(sessionKey, list);
+  let list = sessionStore.get(sessionKey);
+  if (!list) {
+    list = [];
+    sessionStore.set(sessionKey, list);
+  }
+  // epoch ms; formatted to ISO only when a transcript is actually read (runSessionsHistory)
+  list.push({ role, content, at: Date.now() });
+  if (list.length > SESSION_MAX_MESSAGES) list.splice(0, list.length - SESSION_TRIM_TO);
 }
 
 function clearSession(sessionKey) {
   sessionStore.set(sessionKey, []);
 }
 
-/** Replace session history with a given list of { role, content } (for chat.load / import). */
+/**
+ * Replace session history with a given list of { role, content } (for chat.load / import).
+ * Keeps the last SESSION_MAX_MESSAGES; returns how many messages were stored.
+ */
 function setSessionHistory(sessionKey, messages) {
-  const list = (messages || []).map((m) => ({
+  const at = Date.now();
+  const list = (messages || []).slice(-SESSION_MAX_MESSAGES).map((m) => ({
     role: m.role,
     content: typeof m.content === 'string' ? m.content : JSON.stringify(m.content),
-    at: new Date().toISOString()
+    at
   }));
   sessionStore.set(sessionKey, list);
+  return list.length;
 }
 
 function runSessionsList(args) {
@@ -1003,7 +1015,7 @@ function runSessionsList(args) {
 function runSessionsHistory(workspaceRoot, args) {
   const key = args.session_key || SESSION_MAIN;
   const limit = Math.min(50, args.limit || 20);
-  const messages = getSessionHistory(key, limit);
+  const messages = getSessionHistory(key, limit).map((m) => ({ ...m, at: new Date(m.at).toISOString() }));
   return { session_key: key, messages };
 }
 
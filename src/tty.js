@@ -0,0 +1,112 @@
+/**
+ * Terminal prompts shared by onboarding, setup flows and the TUI.
+ * One readline interface is created lazily and reused for every prompt instead of
+ * opening a new one per question. Between prompts it is paused and the terminal is put
+ * back in cooked mode, so the process can exit, Ctrl+C raises SIGINT, and child
+ * processes (npm, clawhub, agent exec) get a normal terminal.
+ */
+
+const readline = require('readline');
+
+let rl = null;
+
+function getTtyInterface() {
+  if (!rl) {
+    rl = readline.createInterface({ input: process.stdin, output: process.stdout });
+    rl.on('close', () => {
+      rl = null;
+    });
+  }
+  return rl;
+}
+
+/** Close the shared interface (before raw-mode input, or when leaving an interactive loop). */
+function closeTty() {
+  if (rl) rl.close();
+}
+
+function setRawMode(on) {
+  if (process.stdin.isTTY) process.stdin.setRawMode(on);
+}
+
+/** Resume the shared interface for reading; readline needs raw mode for line editing. */
+function resumeTty() {
+  const iface = getTtyInterface();
+  setRawMode(true);
+  iface.resume();
+  return iface;
+}
+
+/** Idle the shared interface: stop reading and hand the terminal back in cooked mode. */
+function pauseTty() {
+  if (!rl) return;
+  rl.pause();
+  setRawMode(false);
+}
+
+/** Prompt once and resolve with the raw answer. */
+function ttyAsk(prompt) {
+  return new Promise((resolve) => {
+    const iface = resumeTty();
+    iface.question(prompt, (answer) => {
+      pauseTty();
+      resolve(answer);
+    });
+  });
+}
+
+function ttyQuestion(prompt, defaultVal = '') {
+  const p = defaultVal ? `${prompt} [${defaultVal}]: ` : `${prompt} `;
+  return ttyAsk(p).then((answer) => (answer && answer.trim()) || defaultVal);
+}
+
+/** Ask for input with masked echo (e.g. API key). Uses * per character. */
+function ttyQuestionMasked(prompt) {
+  return new Promise((resolve) => {
+    const stdin = process.stdin;
+    const stdout = process.stdout;
+    if (!stdin.isTTY) {
+      return ttyQuestion(prompt).then(resolve);
+    }
+    // readline would echo the keystrokes too; raw mode owns stdin until Enter
+    closeTty();
+    stdout.write(prompt);
+    stdin.setRawMode(true);
+    stdin.resume();
+    stdin.setEncoding('utf8');
+    let secret = '';
+    const cleanup = () => {
+      stdin.removeListener('data', onData);
+      stdin.setRawMode(false);
+      stdin.pause();
+    };
+    const onData = (ch) => {
+      if (ch === '\n' || ch === '\r' || ch === '\u0004') {
+        cleanup();
+        stdout.write('\n');
+        resolve(secret.trim());
+        return;
+      }
+      if (ch === '\u0003') {
+        cleanup();
+        process.exit(130);
+        return;
+      }
+      if (ch === '\u007f' || ch === '\b') {
+        if (secret.length > 0) {
+          secret = secret.slice(0, -1);
+          stdout.write('\b \b');
+        }
+        return;
+      }
+      secret += ch;
+      stdout.write('*');
+    };
+    stdin.on('data', onData);
+  });
+}
+
+/** Prompt pair in the shape setup flows take (e.g. setupTelegram(envPath, ttyPrompts)). */
+const ttyPrompts = { question: ttyQuestion, questionMasked: ttyQuestionMasked };
+
+module.exports = { getTtyInterface, resumeTty, closeTty, ttyAsk, ttyQuestion, ttyQuestionMasked, ttyPrompts };
@@ -231,8 +231,8 @@ function createWsGateway(opts = {}) {
             sendRes(ws, msg.id, false, { error: 'messages array required' });
             break;
           }
-          setSessionHistory(sessionKey, messages);
-          sendRes(ws, msg.id, true, { sessionKey, replaced: messages.length });
+          const replaced = setSessionHistory(sessionKey, messages);
+          sendRes(ws, msg.id, true, { sessionKey, replaced });
           break;
         }
         case 'agent': {